@@ -0,0 +1,256 @@
+# Text and tables for the Definitions page (pages/1_Definitions.py)
+
+# Table data is literal, so it's defined once here as column headers + row tuples.
+# Tables are rendered to static HTML and sent via st.markdown, so there's no pandas, Arrow encode or table widget for content that never changes
+MODEL_COSTS_COLUMNS = ("Model", "Cost per Input Token", "Cost per Output Token", "Cost per 1M Input Tokens", "Cost per 1M Output Tokens")
+MODEL_COSTS_ROWS = (
+    ("gpt-4o", 0.000001866, 0.000007463801, 1.8660, 11.1958),
+    ("gpt-4o-mini", 0.00000011196, 0.0000004479, 0.11196, 0.4479),
+)
+# Display format per column, applied when the table is rendered
+MODEL_COSTS_FORMATS = ("{}", "{:.10f}", "{:.10f}", "{:.2f}", "{:.2f}")
+
+# Typical token values
+TOKENS_PER_QUESTION_COLUMNS = ("Exchange Type", "Token Range")
+TOKENS_PER_QUESTION_ROWS = (
+    ("Very Short", "5-50"),
+    ("Short", "50-100"),
+    ("Medium", "100-200"),
+    ("Long", "200+"),
+)
+
+RAG_TOKENS_EXAMPLE_COLUMNS = ("Component", "Tokens")
+RAG_TOKENS_EXAMPLE_ROWS = (
+    ("User Question", 7),
+    ("RAG Process", 2000),
+    ("Model Response", 393),
+)
+
+# Example data for a conversation with 4 questions
+EXAMPLE_COLUMNS = ("Question", "User input tokens", "RAG Tokens", "Model output tokens", "Input Tokens", "Notes")
+EXAMPLE_ROWS = (
+    (1, 100, 2000, 300, 2400, "1 + 0"),
+    (2, 100, 2000, 300, 4800, "2 + 1"),
+    (3, 100, 2000, 300, 4800, "3 + 2"),
+    (4, 100, 2000, 300, 4800, "4 + 3"),
+)
+
+
+def _as_html(columns, rows, formats=None):
+    """
+    Render a static table to an HTML string
+    Parameters:
+        columns (tuple): Column headers.
+        rows (tuple): Row tuples, in column order.
+        formats (tuple, optional): Format string per column. Defaults to plain "{}".
+    Returns:
+        str: The <table> HTML
+    """
+    formats = formats or ("{}",) * len(columns)
+    head = "".join(f"<th>{column}</th>" for column in columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{fmt.format(value)}</td>" for fmt, value in zip(formats, row)) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+# Page text. Each expander is sent as one markdown element, with its tables' HTML spliced in between the text blocks
+INTRO_MD = """
+## Cost Estimator Parameters
+
+Parameters used in the Cost Estimator are explained here. 
+"""
+
+MODEL_PARAMETERS_MD = """
+## 1. Model Parameters
+
+### OpenAI Model Selection
+
+Model selection sets the cost per input token and cost per output token according to Azure's OpenAI pricing page. 
+
+### Cost per Input and Output Tokens
+
+**Definition**: The price charged by Azure OpenAI for processing one input token or generating one output token.
+
+- Uses GBP (£)
+- Uses Global Deployment pricing
+- Units are in tokens rather than per hour
+"""
+
+COUNCIL_METRICS_MD = """
+## 2. Council Metrics
+
+### Council Population
+
+**Definition**: The total number of residents in the council area.  
+
+This serves as the base for calculating potential citizen engagement:  
+- Used to estimate total reach  
+- Starting point for conversion calculations  
+
+### Conversion Rate
+
+**Definition**: Percentage of council population that are monthly active users of a council's website.  
+
+**Calculation**: (Monthly Active Users / Total Population) × 100  
+
+**Example**:  
+- Council Population: 220,000  
+- Monthly Active Users: 126,253  
+- Conversion Rate: 57.4%  
+
+This metric helps estimate how many citizens actively interact with the council's website.  
+It's also a metric councils can easily provide from their Google Analytics data.  
+"""
+
+CHATBOT_METRICS_MD = """
+## 3. Chatbot Metrics
+
+### Engagement Rate
+
+**Definition**: Percentage of website visitors who interact with the chatbot.  
+
+Different scenarios provide different assumptions:  
+- **Low**: 2% (1 in 50 visitors use the chatbot)  
+- **Medium**: 3% (1 in 33 visitors use the chatbot)  
+- **Heavy**: 6% (1 in 17 visitors use the chatbot)  
+
+Based on very loose numbers from data.gov.uk  
+
+### Conversations per Engaged User
+
+**Definition**: Average number of separate conversations each engaged user has per month.  
+
+Scenario assumptions:  
+- **Low**: 1.0 (one conversation per user)  
+- **Medium**: 2.2 (some users have multiple conversations)  
+- **Heavy**: 4.6 (users regularly return for multiple queries)  
+
+A conversation is a complete interaction session, which includes multiple questions.  
+
+### Questions per Conversation (Turns)
+
+**Definition**: Average number of questions asked in a single conversation.  
+
+One turn consists of:  
+1. User input/question  
+2. RAG process  
+3. Chatbot response  
+
+Scenario assumptions:  
+- **Low**: 2 turns (brief, focused interactions)  
+- **Medium**: 4 turns (standard query resolution)  
+- **Heavy**: 8 turns (detailed, multi-step interactions)  
+
+**Example of a 3-turn conversation**:  
+1. User asks about council tax → RAG process → Bot responds  
+2. User asks for payment methods → RAG process → Bot responds  
+3. User asks for payment deadline → RAG process → Bot responds  
+
+### User input tokens
+
+**Definition**: The number of tokens used in a user's input.
+"""
+
+USER_INPUT_TOKENS_EXAMPLE_MD = """
+**Example**:
+- **User question: "What are the council tax bands?" (7 tokens)**
+- RAG process: Generates embeddings, performs search, submits question to model with chunks (~2,000 tokens)
+- Model response with detailed explanation (393 tokens)
+- Total = 7 user input tokens
+"""
+
+RAG_TOKENS_MD = """
+### RAG Tokens
+
+**Definition**: The number of tokens consumed during the RAG process.  
+- Essentially all RAG tokens consist of text chunks that are submitted to the model for a contextually aided response
+"""
+
+RAG_TOKENS_EXAMPLE_MD = """
+**Example**:
+- User question: "What are the council tax bands?" (7 tokens)
+- **RAG process: Generates embeddings, performs search, submits question to model with chunks (2,000 tokens)**
+- Model response with detailed explanation (393 tokens)
+- Total = 2,000 RAG tokens
+"""
+
+OUTPUT_TOKENS_MD = """
+### Model output tokens
+
+**Definition**: The number of tokens the model generates for its response.
+
+**Example**:
+- User question: "What are the council tax bands?" (7 tokens)  
+- RAG process: Generates embeddings, performs search, submits question to model with chunks (2,000 tokens)  
+- **Model response with detailed explanation (393 tokens)**
+- Total = 393 model output tokens
+"""
+
+TOKENS_PER_CONVERSATION_MD = """
+### Tokens per Conversation
+
+**Definition**: The total number of tokens consumed in a conversation is calculated using the formula:  
+Qn + Qn-1  
+
+Where:  
+- Qn &nbsp; is the number of tokens for the current question (including User input tokens, RAG tokens, and model output tokens).  
+- Qn-1 &nbsp; is the number of tokens for the current question minus one.
+"""
+
+CONVERSATION_TOTAL_MD = """
+**Total Tokens for the Conversation**:  
+- Example: 2,400 + 4,800 + 4,800 + 4,800 = 16,800 tokens
+- Which is the same as (2 × Questions - 1) × Tokens per Turn: (2 × 4 - 1) × 2,400 = 16,800 tokens
+"""
+
+COST_CALCULATION_MD = """
+## 4. How Costs Are Calculated
+
+The final cost estimate follows this calculation process:  
+
+1. **Calculate Engaged Users**:  
+    ```
+    Council Population × Conversion Rate × Engagement Rate
+    ```
+
+2. **Calculate Total Conversations**:  
+    ```
+    Engaged Users × Conversations per User
+    ```
+
+3. **Calculate Total Tokens**:  
+    ```
+    Total Conversations × (2 × Questions per Conversation - 1) × Tokens per Turn
+    ```
+
+4. **Calculate Final Cost**:  
+    ```
+    Total Tokens × Cost per Token
+    ```
+"""
+
+
+# The whole page is static, so each expander's body (text + table HTML) is assembled once here.
+# (expander label, markdown body) pairs, in page order
+PAGE_SECTIONS = (
+    ("Model Parameters", "\n\n".join((
+        MODEL_PARAMETERS_MD,
+        _as_html(MODEL_COSTS_COLUMNS, MODEL_COSTS_ROWS, MODEL_COSTS_FORMATS),
+    ))),
+    ("Council Metrics", COUNCIL_METRICS_MD),
+    ("Chatbot Metrics", "\n\n".join((
+        CHATBOT_METRICS_MD,
+        _as_html(TOKENS_PER_QUESTION_COLUMNS, TOKENS_PER_QUESTION_ROWS),
+        USER_INPUT_TOKENS_EXAMPLE_MD,
+        RAG_TOKENS_MD,
+        _as_html(RAG_TOKENS_EXAMPLE_COLUMNS, RAG_TOKENS_EXAMPLE_ROWS),
+        RAG_TOKENS_EXAMPLE_MD,
+        OUTPUT_TOKENS_MD,
+        TOKENS_PER_CONVERSATION_MD,
+        _as_html(EXAMPLE_COLUMNS, EXAMPLE_ROWS),
+        CONVERSATION_TOTAL_MD,
+    ))),
+    ("How Costs Are Calculated", COST_CALCULATION_MD),
+)
@@ -1,15 +1,25 @@
 import streamlit as st
-import pandas as pd
 import os
 from datetime import datetime
-
-# Page config
-st.set_page_config(page_title="Azure OpenAI Cost Estimator", layout="wide")
-
-# Hides streamlits header, footer and hambuger menu so folks dont break shit
-st.markdown("""<style>#MainMenu {visibility: hidden;} footer {visibility: hidden;} </style>""", unsafe_allow_html=True,)
-
-# Get last modified date/time to incolude in title for last published date
+from types import MappingProxyType
+from scenarios import (
+    SCENARIO_NAMES,
+    SCENARIO_RATES,
+    SCENARIO_CONVS,
+    SCENARIO_QS,
+    CUSTOM_IDX,
+    SCENARIO_PARAM_FORMATS,
+    SCENARIO_PARAM_COLS,
+    DETAIL_TABLE_TEMPLATE,
+)
+
+# Page config. Shared by every page as main.py is the single entrypoint (see st.navigation at the bottom); page titles come from st.Page
+st.set_page_config(layout="wide")
+
+# Streamlits header and hambuger menu are hidden in .streamlit/config.toml (hideTopBar + toolbarMode) so folks dont break shit
+
+# Get last modified date/time to incolude in title for last published date.
+# Left uncached on purpose: st.cache_data only keys on this function's own source, so edits elsewhere in the file would show a stale date. A stat is ~1µs
 def get_last_modified_time():
     file_path = __file__
     last_modified_timestamp = os.path.getmtime(file_path)
@@ -18,44 +28,20 @@ def get_last_modified_time():
 
 last_modified_datetime = get_last_modified_time()
 
-# ss
-if "calculated_metrics" not in st.session_state:
-    st.session_state["calculated_metrics"] = {}
-
-# Static vars
-MODEL_COSTS = {
-    "gpt-4o": {
-        "input_token": 0.000001866,
-        "output_token": 0.000007463801,
-    },
-    "gpt-4o-mini": {
-        "input_token": 0.00000011196,
-        "output_token": 0.0000004479
-    }
-}
-
-SCENARIOS = {
-    "Low": {
-        "engagement_rate": 0.02,
-        "conversations_per_user": 1.0,
-        "avg_questions_per_convo": 2,
-    },
-    "Medium": {
-        "engagement_rate": 0.03,
-        "conversations_per_user": 2.2,
-        "avg_questions_per_convo": 4,
-    },
-    "Heavy": {
-        "engagement_rate": 0.06,
-        "conversations_per_user": 4.6,
-        "avg_questions_per_convo": 8,
-    },
-    "Custom": {
-        "engagement_rate": 0.05,  # Default values; will be overridden by user inputs
-        "conversations_per_user": 2.1,
-        "avg_questions_per_convo": 5,
-    },
-}
+# Static vars (read-only views so they can't be mutated across reruns)
+# Model costs as (input token, output token) in GBP
+MODEL_COSTS = MappingProxyType({
+    "gpt-4o": (0.000001866, 0.000007463801),
+    "gpt-4o-mini": (0.00000011196, 0.0000004479),
+})
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Sidebar defaults, based on North Somerset's data
+DEFAULT_COUNCIL_POPULATION = 220000
+DEFAULT_CONVERSION_PCT = (126253 / DEFAULT_COUNCIL_POPULATION) * 100
+
+# Selectbox options come straight from MODEL_COSTS so every selection has a matching entry
+MODEL_OPTIONS = tuple(MODEL_COSTS)
 
 # funcs
 def get_default_cost_per_token(model_type):
@@ -64,52 +50,40 @@ def get_default_cost_per_token(model_type):
     Parameters:
         model_type (str): The selected OpenAI model.
     Returns:
-        dict: Dict containing input and output token costs
+        tuple: Input and output token costs (falls back to the default model's costs)
     """
-    return MODEL_COSTS.get(model_type, {}) 
+    return MODEL_COSTS.get(model_type, MODEL_COSTS[DEFAULT_MODEL])
 
-def calculate_costs(params, cost_per_token, total_visitors, tokens_per_question, rag_tokens, tokens_per_answer):
+def calculate_costs(engagement_rate, conversations_per_user, avg_questions_per_convo, cost_per_token, total_visitors, tokens_per_turn):
     """
-    Calculate est costs and chatbot usage 
+    Calculate est costs and chatbot usage. Plain arithmetic, so passing NumPy arrays (one element per scenario) calcs every scenario at once
     Parameters:
-        params (dict): Contains 'engagement_rate', 'conversations_per_user', and 'avg_questions_per_convo'.
+        engagement_rate (float | np.ndarray): Percentage of visitors using the chatbot (as a decimal).
+        conversations_per_user (float | np.ndarray): Average conversations per engaged user.
+        avg_questions_per_convo (int | np.ndarray): Questions per conversation (turns).
         cost_per_token (float): Cost per input token in GBP.
         total_visitors (int): Number of unique visitors per month
-        tokens_per_question (int): Tokens per user question
-        rag_tokens (int): Tokens used during the RAG process
-        tokens_per_answer (int): Tokens per model answer
+        tokens_per_turn (int): User input + RAG + model output tokens for one turn
     Returns:
         dict: Calculated metrics and est cost
     """
-    engaged_users = total_visitors * params["engagement_rate"]
-    total_conversations = engaged_users * params["conversations_per_user"]
-    
-    tokens_per_turn = tokens_per_question + rag_tokens + tokens_per_answer
-    tokens_per_conversation = 0
-    previous_tokens = 0
-
-    # See def page for explanation on what toekns are used in conversations 
-    for i in range(1, params["avg_questions_per_convo"] + 1):
-        current_tokens = tokens_per_turn
-        if i > 1:
-            tokens_per_conversation += current_tokens + previous_tokens
-        else:
-            tokens_per_conversation += current_tokens
-        previous_tokens = current_tokens
+    engaged_users = total_visitors * engagement_rate
+    total_conversations = engaged_users * conversations_per_user
+
+    # See def page for explanation on what toekns are used in conversations.
+    # Every turn after the first also resends the previous turn, so n turns = (2n - 1) turns of tokens
+    tokens_per_conversation = (2 * avg_questions_per_convo - 1) * tokens_per_turn
 
     total_tokens = total_conversations * tokens_per_conversation
     estimated_cost = total_tokens * cost_per_token
-    
-    # Add to ss
-    st.session_state['calculated_metrics'] = {
+
+    return {
         "Engaged Users": engaged_users,
         "Total Conversations": total_conversations,
         "Tokens per Conversation": tokens_per_conversation,
         "Total Tokens": total_tokens,
         "Estimated Cost (GBP)": estimated_cost,
     }
-    
-    return st.session_state['calculated_metrics']
 
 def get_sidebar_inputs():
     """
@@ -122,113 +96,119 @@ def get_sidebar_inputs():
     # Model Selection
     model_type = st.sidebar.selectbox(
         "Select OpenAI Model",
-        options=["gpt-4o", "gpt-4o-mini"],
-        index=1,
+        options=MODEL_OPTIONS,
+        index=MODEL_OPTIONS.index(DEFAULT_MODEL),
         help="Sets the input and output cost per token.",
     )
-    default_costs = get_default_cost_per_token(model_type)
-    default_cost_per_input_token = default_costs.get("input_token", 0.000001866)
-    default_cost_per_output_token = default_costs.get("output_token", 0.000007463801)
-    
-    # Custom Token Costs (changes all scenario values)
-    custom_cost_per_token = st.sidebar.number_input(
-        "Cost per Input Token",
-        min_value=0.000000001,
-        max_value=0.01,
-        value=default_cost_per_input_token,
-        step=0.000000001,
-        format="%.10f",
-        help="The cost per input token in GBP.",
-    )
+    default_cost_per_input_token, default_cost_per_output_token = get_default_cost_per_token(model_type)
     
-    custom_cost_per_output_token = st.sidebar.number_input(
-        "Cost per Output Token",
-        min_value=0.000000001,
-        max_value=0.01,
-        value=default_cost_per_output_token,
-        step=0.000000001,
-        format="%.10f",
-        help="The cost per output token in GBP.",
-    )
+    # Batch the remaining inputs in a form so edits only rerun the app once, on submit
+    with st.sidebar.form("params"):
+        # Custom Token Costs (changes all scenario values)
+        custom_cost_per_token = st.number_input(
+            "Cost per Input Token",
+            min_value=0.000000001,
+            max_value=0.01,
+            value=default_cost_per_input_token,
+            step=0.000000001,
+            format="%.10f",
+            help="The cost per input token in GBP.",
+        )
 
-    # Council Metrics
-    st.sidebar.subheader("Council Metrics")
-    council_population = st.sidebar.number_input(
-        "Council Population",
-        min_value=1,
-        value=220000,
-        step=1000,
-        help="Enter the population of the council.",
-    )
+        custom_cost_per_output_token = st.number_input(
+            "Cost per Output Token",
+            min_value=0.000000001,
+            max_value=0.01,
+            value=default_cost_per_output_token,
+            step=0.000000001,
+            format="%.10f",
+            help="The cost per output token in GBP.",
+        )
 
-    conversion_rate = (
-        st.sidebar.number_input(
-            "Conversion Rate (%)",
-            min_value=0.0,
-            max_value=100.0,
-            value=(126253 / 220000) * 100,  # Default based on North Somerset's data
-            step=0.1,
-            help="Percentage of the council population that are monthly active users.",
+        # Council Metrics
+        st.subheader("Council Metrics")
+        council_population = st.number_input(
+            "Council Population",
+            min_value=1,
+            value=DEFAULT_COUNCIL_POPULATION,
+            step=1000,
+            help="Enter the population of the council.",
         )
-        / 100  # Convert to decimal
-    )
 
-    # Calculate monthly unique visitors
-    monthly_unique_visitors = council_population * conversion_rate
+        conversion_rate = (
+            st.number_input(
+                "Conversion Rate (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=DEFAULT_CONVERSION_PCT,
+                step=0.1,
+                help="Percentage of the council population that are monthly active users.",
+            )
+            / 100  # Convert to decimal
+        )
 
-    # Chatbot inputs for custom scenario
-    st.sidebar.subheader("Chatbot Metrics")
-    engagement_rate = (
-        st.sidebar.number_input(
-            "Engagement Rate (%)",
+        # Calculate monthly unique visitors
+        monthly_unique_visitors = council_population * conversion_rate
+
+        # Chatbot inputs for custom scenario
+        st.subheader("Chatbot Metrics")
+        engagement_rate = (
+            st.number_input(
+                "Engagement Rate (%)",
+                min_value=0.0,
+                max_value=100.0,
+                value=3.0,
+                step=0.1,
+                help="Percentage of active users who engage with the chatbot.",
+            )
+            / 100
+        )
+        conversations_per_user = st.number_input(
+            "Conversations per Engaged User",
             min_value=0.0,
-            max_value=100.0,
-            value=3.0,
+            value=1.2,
             step=0.1,
-            help="Percentage of active users who engage with the chatbot.",
+            help="Conversations a user has per visit.",
+        )
+        avg_questions_per_convo = st.number_input(
+            "Questions per Conversation (Turns)",
+            min_value=1,
+            max_value=100,  # Keeps the int64 closed form ((2n - 1) × tokens per turn) well clear of overflow
+            value=4,
+            step=1,
+            help="The number of questions a user asks in a conversation (turn = user question + model response).",
         )
-        / 100
-    )
-    conversations_per_user = st.sidebar.number_input(
-        "Conversations per Engaged User",
-        min_value=0.0,
-        value=1.2,
-        step=0.1,
-        help="Conversations a user has per visit.",
-    )
-    avg_questions_per_convo = st.sidebar.number_input(
-        "Questions per Conversation (Turns)",
-        min_value=1,
-        value=4,
-        step=1,
-        help="The number of questions a user asks in a conversation (turn = user question + model response).",
-    )
 
-    # Token Inputs
-    tokens_per_question = st.sidebar.number_input(
-        "User Input Tokens",
-        min_value=100,
-        max_value=10000,
-        value=100,
-        step=50,
-        help="The number of tokens in a user's question.",
-    )
-    rag_tokens = st.sidebar.number_input(
-        "RAG Tokens",
-        min_value=1000,
-        max_value=20000,
-        value=2000,
-        step=1000,
-        help="Number of tokens used during RAG process, i.e., chunks submitted to model.",
-    )
-    tokens_per_answer = st.sidebar.number_input(
-        "Model Output Tokens",
-        min_value=200,
-        max_value=10000,
-        value=300,
-        step=50,
-        help="The number of tokens the model generates for its response.",
-    )
+        # Token Inputs
+        tokens_per_question = st.number_input(
+            "User Input Tokens",
+            min_value=100,
+            max_value=10000,
+            value=100,
+            step=50,
+            help="The number of tokens in a user's question.",
+        )
+        rag_tokens = st.number_input(
+            "RAG Tokens",
+            min_value=1000,
+            max_value=20000,
+            value=2000,
+            step=1000,
+            help="Number of tokens used during RAG process, i.e., chunks submitted to model.",
+        )
+        tokens_per_answer = st.number_input(
+            "Model Output Tokens",
+            min_value=200,
+            max_value=10000,
+            value=300,
+            step=50,
+            help="The number of tokens the model generates for its response.",
+        )
+
+        # Calculate tokens per turn (every calc only needs the total)
+        tokens_per_turn = tokens_per_question + rag_tokens + tokens_per_answer
+
+        st.form_submit_button("Update")
 
     return {
         "model_type": model_type,
@@ -243,59 +223,136 @@ def get_sidebar_inputs():
         "tokens_per_question": tokens_per_question,
         "rag_tokens": rag_tokens,
         "tokens_per_answer": tokens_per_answer,
+        "tokens_per_turn": tokens_per_turn,
     }
 
-def generate_scenarios(user_inputs, custom_costs):
+# Not st.cache_data: its key is only this function's source + args, so edits to the scenarios.py data would be served stale.
+# After the closed form it's a handful of NumPy ops anyway
+def build_scenarios_table(custom_params, cost_per_token, total_visitors, tokens_per_turn):
     """
-    Generate cost est for each scenario    
+    Generate cost est for each scenario
     Parameters:
-        user_inputs (dict): User inputs from the sidebar.
-        custom_costs (dict): Custom cost per token inputs.
+        custom_params (tuple): Sorted (name, value) pairs overriding the Custom scenario.
+        cost_per_token (float): Cost per input token in GBP.
+        total_visitors (int): Number of unique visitors per month
+        tokens_per_turn (int): User input + RAG + model output tokens for one turn
     Returns:
-        pd.DataFrame: DataFrame containing cost ests for each scenario
+        tuple: Table columns (dict of lists) with cost ests for each scenario, and dict of calcd metrics keyed by scenario name
     """
-    data = []
-    for scenario_name, params in SCENARIOS.items():
-        if scenario_name == "Custom":
-            # Override custom scenrio params with user inputs
-            current_params = {
-                "engagement_rate": user_inputs["engagement_rate"],
-                "conversations_per_user": user_inputs["conversations_per_user"],
-                "avg_questions_per_convo": user_inputs["avg_questions_per_convo"],
-            }
-        else:
-            # Use scenarios values
-            current_params = params
-
-        estimated = calculate_costs(
-            current_params,
-            custom_costs["custom_cost_per_token"],
-            user_inputs["monthly_unique_visitors"],
-            user_inputs["tokens_per_question"],
-            user_inputs["rag_tokens"],
-            user_inputs["tokens_per_answer"]
-        )
+    # Copy so the shared module arrays aren't touched, then override custom scenrio params with user inputs
+    custom = dict(custom_params)
+    engagement_rates = SCENARIO_RATES.copy()
+    conversations_per_user = SCENARIO_CONVS.copy()
+    avg_questions_per_convo = SCENARIO_QS.copy()
+    engagement_rates[CUSTOM_IDX] = custom["engagement_rate"]
+    conversations_per_user[CUSTOM_IDX] = custom["conversations_per_user"]
+    avg_questions_per_convo[CUSTOM_IDX] = custom["avg_questions_per_convo"]
+
+    # All scenarios in one go
+    estimated = calculate_costs(
+        engagement_rates,
+        conversations_per_user,
+        avg_questions_per_convo,
+        cost_per_token,
+        total_visitors,
+        tokens_per_turn,
+    )
+    engaged_users = estimated["Engaged Users"]
+    estimated_cost = estimated["Estimated Cost (GBP)"]
 
-        data.append({
-            "Scenario": scenario_name,
-            "Engagement Rate (%)": f"{current_params['engagement_rate'] * 100:.1f}%",
-            "Engaged Users": f"{estimated['Engaged Users']:,.0f}",
-            "Conversations per User": f"{current_params['conversations_per_user']:.1f}",
-            "Qs per Conversation": f"{current_params['avg_questions_per_convo']:.0f}",
-            "Cost per Token (GBP)": f"£{custom_costs['custom_cost_per_token']:.10f}",
-            "Est Monthly Cost (GBP)": f"£{estimated['Estimated Cost (GBP)']:,.2f}", 
-            "Est Annual Cost (GBP)": f"£{estimated['Estimated Cost (GBP)'] * 12:.2f}",
-        })
-    return pd.DataFrame(data)
-
-def display_estimated_costs(df):
+    # Per scenario metrics, kept so the detailed view doesn't have to recalculate
+    results = {
+        scenario_name: {metric: values[i].item() for metric, values in estimated.items()}
+        for i, scenario_name in enumerate(SCENARIO_NAMES)
+    }
+
+    # Fixed scenarios are preformatted, so only format the Custom row
+    param_cols = {}
+    for col, param, fmt in SCENARIO_PARAM_FORMATS:
+        param_cols[col] = list(SCENARIO_PARAM_COLS[col])
+        param_cols[col][CUSTOM_IDX] = fmt.format(custom[param])
+
+    # Same for every row, so format it once
+    cost_str = f"£{cost_per_token:.10f}"
+
+    # Plain columns; st.table takes these directly so there's no need for a DataFrame here
+    table = {
+        "Scenario": SCENARIO_NAMES,
+        "Engagement Rate (%)": param_cols["Engagement Rate (%)"],
+        "Engaged Users": [f"{users:,.0f}" for users in engaged_users],
+        "Conversations per User": param_cols["Conversations per User"],
+        "Qs per Conversation": param_cols["Qs per Conversation"],
+        "Cost per Token (GBP)": [cost_str] * len(SCENARIO_NAMES),
+        "Est Monthly Cost (GBP)": [f"£{cost:,.2f}" for cost in estimated_cost],
+        "Est Annual Cost (GBP)": [f"£{cost * 12:.2f}" for cost in estimated_cost],
+    }
+
+    return table, results
+
+def display_estimated_costs(table):
     """
     Est monthly costs as a table.
     Parameters:
-        df (pd.DataFrame): DataFrame containing cost ests.
+        table (dict): Table columns containing cost ests.
     """
     st.subheader("Estimated Monthly Costs")
-    st.table(df)
+    st.table(table)
+
+def build_detailed_table(selected_params, detailed_estimated, council_population, conversion_rate, monthly_unique_visitors, tokens_per_question, rag_tokens, tokens_per_answer, tokens_per_turn, cost_per_token):
+    """
+    Build the breakdown table of the cost calcs (uncached for the same reason as build_scenarios_table; it's one str.format call)
+    Parameters:
+        selected_params (tuple): Sorted (name, value) pairs for the selected scenario.
+        detailed_estimated (tuple): Sorted (name, value) pairs of calcd metrics.
+        council_population (int): Total population in council area
+        conversion_rate (float): Share of population who visit the website (as a decimal)
+        monthly_unique_visitors (float): Number of unique visitors per month
+        tokens_per_question (int): Tokens per user question
+        rag_tokens (int): Tokens used during the RAG process
+        tokens_per_answer (int): Tokens per model answer
+        tokens_per_turn (int): User input + RAG + model output tokens for one turn
+        cost_per_token (float): Cost per input token in GBP.
+    Returns:
+        str: Markdown table of the metric, value and notes for each step of the calc
+    """
+    selected_params = dict(selected_params)
+    detailed_estimated = dict(detailed_estimated)
+
+    # Thousands-separated counts
+    population, visitors, engaged_users, conversations, turn_tokens, tokens_per_convo, total_tokens = (
+        format(int(count), ",d")
+        for count in (
+            council_population,
+            monthly_unique_visitors,
+            detailed_estimated["Engaged Users"],
+            detailed_estimated["Total Conversations"],
+            tokens_per_turn,
+            detailed_estimated["Tokens per Conversation"],
+            detailed_estimated["Total Tokens"],
+        )
+    )
+
+    # Static breakdown, so a markdown table is enough (no interactive grid to mount)
+    return DETAIL_TABLE_TEMPLATE.format(
+        population=population,
+        conversion_rate=f"{conversion_rate * 100:.2f}%",
+        visitors=visitors,
+        engagement_rate=f"{selected_params['engagement_rate'] * 100:.2f}%",
+        engaged_users=engaged_users,
+        conversations_per_user=f"{selected_params['conversations_per_user']:.1f}",
+        conversations_per_user_exact=selected_params["conversations_per_user"],
+        conversations=conversations,
+        questions=selected_params["avg_questions_per_convo"],
+        tokens_per_turn=turn_tokens,
+        tokens_per_question=tokens_per_question,
+        rag_tokens=f"{rag_tokens:,}",
+        tokens_per_answer=tokens_per_answer,
+        tokens_per_convo=tokens_per_convo,
+        total_tokens=total_tokens,
+        cost_per_token=f"£{cost_per_token:.10f}",
+        monthly_cost=f"£{detailed_estimated['Estimated Cost (GBP)']:.2f}",
+        annual_cost=f"£{detailed_estimated['Estimated Cost (GBP)'] * 12:.2f}",
+    )
 
 def display_detailed_calculation(selected_params, detailed_estimated, user_inputs, custom_costs):
     """
@@ -308,91 +365,21 @@ def display_detailed_calculation(selected_params, detailed_estimated, user_input
     """
     st.subheader("Calculation for Custom Scenario")
 
-    tokens_per_turn = user_inputs['tokens_per_question'] + user_inputs['rag_tokens'] + user_inputs['tokens_per_answer']
-    
-    # Included in-line values in the notes section so examples are easier to understand
-    detailed_data = [
-        {
-            "Metric": "Council Population",
-            "Value": f"{int(user_inputs['council_population']):,}",
-            "Notes": "Total population in council area",
-        },
-        {
-            "Metric": "Conversion Rate",
-            "Value": f"{user_inputs['conversion_rate'] * 100:.2f}%",
-            "Notes": "Percentage of population who visit the website",
-        },
-        {
-            "Metric": "Monthly Unique Visitors",
-            "Value": f"{int(user_inputs['monthly_unique_visitors']):,}",
-            "Notes": f"Population ({int(user_inputs['council_population']):,}) × Conversion Rate ({user_inputs['conversion_rate'] * 100:.2f}%)",
-        },
-        {
-            "Metric": "Engagement Rate",
-            "Value": f"{selected_params['engagement_rate'] * 100:.2f}%",
-            "Notes": "Percentage of visitors using chatbot",
-        },
-        {
-            "Metric": "Engaged Users",
-            "Value": f"{int(detailed_estimated['Engaged Users']):,}",
-            "Notes": f"Monthly Visitors ({int(user_inputs['monthly_unique_visitors']):,}) × Engagement Rate ({selected_params['engagement_rate'] * 100:.2f}%)",
-        },
-        {
-            "Metric": "Conversations per User",
-            "Value": f"{selected_params['conversations_per_user']:.1f}",
-            "Notes": "Average conversations per engaged user",
-        },
-        {
-            "Metric": "Total Conversations",
-            "Value": f"{int(detailed_estimated['Total Conversations']):,}",
-            "Notes": f"Engaged Users ({int(detailed_estimated['Engaged Users']):,}) × Conversations per User ({selected_params['conversations_per_user']})",
-        },
-        {
-            "Metric": "Questions per Conversation",
-            "Value": f"{selected_params['avg_questions_per_convo']}",
-            "Notes": "Number of questions asked in a conversation (Turns)",
-        },
-        {
-            "Metric": "Tokens per Turn",
-            "Value": f"{tokens_per_turn:,}",
-            "Notes": f"User input tokens ({user_inputs['tokens_per_question']}) + RAG tokens ({user_inputs['rag_tokens']:,}) + Answer tokens ({user_inputs['tokens_per_answer']})",
-        },
-        {
-            "Metric": "Tokens per Conversation",
-            "Value": f"{int(detailed_estimated['Tokens per Conversation']):,}",
-            "Notes": f"Questions per conversation × Tokens per Turn ({tokens_per_turn:,})",
-        },
-        {
-            "Metric": "Total Monthly Tokens",
-            "Value": f"{int(detailed_estimated['Total Tokens']):,}",
-            "Notes": f"Total Conversations ({int(detailed_estimated['Total Conversations']):,}) × Tokens per Conversation ({int(detailed_estimated['Tokens per Conversation']):,})",
-        },
-        {
-            "Metric": "Cost per Input Token",
-            "Value": f"£{custom_costs['custom_cost_per_token']:.10f}",
-            "Notes": "Price per input token processed",
-        },
-        {
-            "Metric": "Est Monthly Cost",
-            "Value": f"£{detailed_estimated['Estimated Cost (GBP)']:.2f}",
-            "Notes": f"Total Tokens ({int(detailed_estimated['Total Tokens']):,}) × Cost per Token (£{custom_costs['custom_cost_per_token']:.10f})",
-        },
-        {
-            "Metric": "Est Annual Cost",
-            "Value": f"£{detailed_estimated['Estimated Cost (GBP)'] * 12:.2f}",
-            "Notes": "Estimated Monthly Cost × 12",
-        },
-    ]
-
-    detailed_df = pd.DataFrame(detailed_data)
-
-    st.dataframe(
-        detailed_df,
-        hide_index=True,
-        height=((len(detailed_df) + 1) * 35) + 3, # Hacky workaround to avoid scrollbars on the table
-        use_container_width=True, 
+    detailed_table = build_detailed_table(
+        tuple(sorted(selected_params.items())),
+        tuple(sorted(detailed_estimated.items())),
+        user_inputs["council_population"],
+        user_inputs["conversion_rate"],
+        user_inputs["monthly_unique_visitors"],
+        user_inputs["tokens_per_question"],
+        user_inputs["rag_tokens"],
+        user_inputs["tokens_per_answer"],
+        user_inputs["tokens_per_turn"],
+        custom_costs["custom_cost_per_token"],
     )
 
+    st.markdown(detailed_table)
+
 def main():
     st.header("Azure OpenAI API Cost Estimator")
     st.markdown(f"Estimates the monthly cost of the Azure OpenAI Service. Last updated on: {last_modified_datetime}")
@@ -404,27 +391,31 @@ def main():
         "custom_cost_per_output_token": user_inputs["custom_cost_per_output_token"],
     }
 
+    custom_params = {
+        "engagement_rate": user_inputs["engagement_rate"],
+        "conversations_per_user": user_inputs["conversations_per_user"],
+        "avg_questions_per_convo": user_inputs["avg_questions_per_convo"],
+    }
+
     # Eval cost ests
-    cost_estimates_df = generate_scenarios(user_inputs, custom_costs)
-    display_estimated_costs(cost_estimates_df)
-
-    with st.expander("Show Custom Scenario Details"):
-        custom_params = {
-            "engagement_rate": user_inputs["engagement_rate"],
-            "conversations_per_user": user_inputs["conversations_per_user"],
-            "avg_questions_per_convo": user_inputs["avg_questions_per_convo"],
-        }
-
-        detailed_estimated = calculate_costs(
-            custom_params,
-            custom_costs["custom_cost_per_token"],
-            user_inputs["monthly_unique_visitors"],
-            user_inputs["tokens_per_question"],
-            user_inputs["rag_tokens"],
-            user_inputs["tokens_per_answer"]
-        )
+    cost_estimates, scenario_results = build_scenarios_table(
+        tuple(sorted(custom_params.items())),
+        custom_costs["custom_cost_per_token"],
+        user_inputs["monthly_unique_visitors"],
+        user_inputs["tokens_per_turn"],
+    )
+    display_estimated_costs(cost_estimates)
+
+    # Toggle rather than expander: an expander's body still runs (and is sent) while collapsed
+    if st.toggle("Show Custom Scenario Details"):
+        detailed_estimated = scenario_results["Custom"]
 
         display_detailed_calculation(custom_params, detailed_estimated, user_inputs, custom_costs)
 
 if __name__ == "__main__":
-    main()
+    # Route all pages through here so the page config above is applied once rather than re-set by each page
+    pg = st.navigation([
+        st.Page(main, title="Azure OpenAI Cost Estimator", default=True),
+        st.Page("pages/1_Definitions.py", title="Cost Estimator Definitions", icon="📚"),
+    ])
+    pg.run()
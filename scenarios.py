@@ -0,0 +1,77 @@
+import numpy as np
+from types import MappingProxyType
+
+# Scenario data and the tables derived from it.
+# Static data lives in imported modules (this one and definitions.py) rather than in the page scripts: Streamlit re-executes
+# a page's body on every rerun, whereas an imported module runs once per process (cached in sys.modules) and, unlike
+# st.cache_data, is reloaded when its file is edited, so it never serves stale data
+
+# Read-only view so it can't be mutated across reruns
+SCENARIOS = MappingProxyType({
+    "Low": {
+        "engagement_rate": 0.02,
+        "conversations_per_user": 1.0,
+        "avg_questions_per_convo": 2,
+    },
+    "Medium": {
+        "engagement_rate": 0.03,
+        "conversations_per_user": 2.2,
+        "avg_questions_per_convo": 4,
+    },
+    "Heavy": {
+        "engagement_rate": 0.06,
+        "conversations_per_user": 4.6,
+        "avg_questions_per_convo": 8,
+    },
+    "Custom": {
+        "engagement_rate": 0.05,  # Default values; will be overridden by user inputs
+        "conversations_per_user": 2.1,
+        "avg_questions_per_convo": 5,
+    },
+})
+
+# Scenario params as one array per param (same order as SCENARIO_NAMES) so the maths runs over every scenario at once.
+# Read-only; build_scenarios_table copies them before setting the Custom slot
+SCENARIO_NAMES = tuple(SCENARIOS)
+SCENARIO_RATES = np.fromiter((p["engagement_rate"] for p in SCENARIOS.values()), dtype=np.float64)
+SCENARIO_CONVS = np.fromiter((p["conversations_per_user"] for p in SCENARIOS.values()), dtype=np.float64)
+SCENARIO_QS = np.fromiter((p["avg_questions_per_convo"] for p in SCENARIOS.values()), dtype=np.int64)
+SCENARIO_RATES.flags.writeable = False
+SCENARIO_CONVS.flags.writeable = False
+SCENARIO_QS.flags.writeable = False
+CUSTOM_IDX = SCENARIO_NAMES.index("Custom")
+
+# Scenario param columns as (table column, param, format). Fixed scenarios are formatted once here; only the Custom row changes per rerun
+SCENARIO_PARAM_FORMATS = (
+    ("Engagement Rate (%)", "engagement_rate", "{:.1%}"),
+    ("Conversations per User", "conversations_per_user", "{:.1f}"),
+    ("Qs per Conversation", "avg_questions_per_convo", "{:.0f}"),
+)
+SCENARIO_PARAM_COLS = MappingProxyType({
+    col: tuple(fmt.format(p[param]) for p in SCENARIOS.values()) for col, param, fmt in SCENARIO_PARAM_FORMATS
+})
+
+# (Metric, Value, Notes) rows of the detailed breakdown. Included in-line values in the notes section so examples are easier to understand.
+# Placeholders are filled with already formatted strings, so each value is formatted once however often it appears.
+# conversations_per_user_exact is the unrounded input, so the Total Conversations note multiplies out
+DETAIL_ROWS = (
+    ("Council Population", "{population}", "Total population in council area"),
+    ("Conversion Rate", "{conversion_rate}", "Percentage of population who visit the website"),
+    ("Monthly Unique Visitors", "{visitors}", "Population ({population}) × Conversion Rate ({conversion_rate})"),
+    ("Engagement Rate", "{engagement_rate}", "Percentage of visitors using chatbot"),
+    ("Engaged Users", "{engaged_users}", "Monthly Visitors ({visitors}) × Engagement Rate ({engagement_rate})"),
+    ("Conversations per User", "{conversations_per_user}", "Average conversations per engaged user"),
+    ("Total Conversations", "{conversations}", "Engaged Users ({engaged_users}) × Conversations per User ({conversations_per_user_exact})"),
+    ("Questions per Conversation", "{questions}", "Number of questions asked in a conversation (Turns)"),
+    ("Tokens per Turn", "{tokens_per_turn}", "User input tokens ({tokens_per_question}) + RAG tokens ({rag_tokens}) + Answer tokens ({tokens_per_answer})"),
+    ("Tokens per Conversation", "{tokens_per_convo}", "(2 × Questions per conversation ({questions}) - 1) × Tokens per Turn ({tokens_per_turn})"),
+    ("Total Monthly Tokens", "{total_tokens}", "Total Conversations ({conversations}) × Tokens per Conversation ({tokens_per_convo})"),
+    ("Cost per Input Token", "{cost_per_token}", "Price per input token processed"),
+    ("Est Monthly Cost", "{monthly_cost}", "Total Tokens ({total_tokens}) × Cost per Token ({cost_per_token})"),
+    ("Est Annual Cost", "{annual_cost}", "Estimated Monthly Cost × 12"),
+)
+
+# Whole breakdown of the Custom scenario as one markdown table template, joined once here and filled with a single str.format call
+DETAIL_TABLE_TEMPLATE = "\n".join(
+    ["| Metric | Value | Notes |", "|---|---|---|"] + [f"| {metric} | {value} | {notes} |" for metric, value, notes in DETAIL_ROWS]
+)
@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from main import calculate_costs
+
+
+def _loop_tokens_per_conversation(avg_questions_per_convo, tokens_per_turn):
+    # Original accumulator loop from calculate_costs, kept here as the reference for the closed form
+    tokens_per_conversation = 0
+    previous_tokens = 0
+    for i in range(1, avg_questions_per_convo + 1):
+        current_tokens = tokens_per_turn
+        if i > 1:
+            tokens_per_conversation += current_tokens + previous_tokens
+        else:
+            tokens_per_conversation += current_tokens
+        previous_tokens = current_tokens
+    return tokens_per_conversation
+
+
+class TestTokensPerConversation(unittest.TestCase):
+    def test_closed_form_matches_loop(self):
+        for tokens_per_turn in (1, 2400, 12345):
+            for n in range(1, 21):
+                with self.subTest(n=n, tokens_per_turn=tokens_per_turn):
+                    estimated = calculate_costs(0.03, 1.2, n, 0.000001866, 1000, tokens_per_turn)
+                    self.assertEqual(estimated["Tokens per Conversation"], _loop_tokens_per_conversation(n, tokens_per_turn))
+
+    def test_closed_form_matches_loop_over_arrays(self):
+        questions = np.arange(1, 21)
+        estimated = calculate_costs(0.03, 1.2, questions, 0.000001866, 1000, 2400)
+        expected = [_loop_tokens_per_conversation(n, 2400) for n in range(1, 21)]
+        self.assertEqual(estimated["Tokens per Conversation"].tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()